@@ -0,0 +1,221 @@
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import lru
+
+SOURCE_DIR = 'image'
+OUTPUT_DIR = os.path.join('static', 'img')
+MANIFEST = 'manifest.json'
+
+# Streamlit serves ./static at app/static when server.enableStaticServing is
+# on (see .streamlit/config.toml). Variant filenames carry a content hash, so
+# a proxy in front can cache these URLs forever.
+STATIC_URL = 'app/static/img'
+
+# Width buckets in device pixels. The largest bucket covers a half-width column
+# on a 2x display; anything wider is never shown at that size.
+WIDTHS = [320, 480, 720, 960]
+SIDEBAR_WIDTH = 640
+COLUMN_WIDTH = 720
+
+# How wide images are laid out, in CSS pixels, so the browser can pick the
+# smallest bucket from srcset: half of Streamlit's centered 736px content
+# column, or the full width on phones, and the default sidebar width.
+COLUMN_SIZES = '(max-width: 640px) 100vw, 368px'
+SIDEBAR_SIZES = '300px'
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+# Each image also gets a tiny blurred copy, inlined into the page as a data
+# URI and shown until the full image loads. Stretched to the full size by the
+# browser, 24 pixels across is enough for the colors and rough shapes.
+PLACEHOLDER_WIDTH = 24
+PLACEHOLDER_QUALITY = 40
+
+def file_hash(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+def _normalize(image):
+    if image.mode in ('RGBA', 'LA', 'P'):
+        return image.convert('RGBA')
+    return image.convert('RGB')
+
+def _flatten(image):
+    from PIL import Image
+
+    if image.mode != 'RGBA':
+        return image
+    background = Image.new('RGB', image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel('A'))
+    return background
+
+def _encode(image, fmt, quality):
+    buffer = io.BytesIO()
+    if fmt == 'WEBP':
+        image.save(buffer, fmt, quality=quality, method=6)
+    else:
+        image.save(buffer, fmt, quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+def _write(out_dir, stem, width, ext, data):
+    name = f"{stem}-{width}-{file_hash(data)}.{ext}"
+    path = os.path.join(out_dir, name)
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(data)
+    return name
+
+def placeholder(image):
+    from PIL import Image, ImageFilter
+
+    # It would show through the transparent parts of the full image.
+    if image.mode == 'RGBA' and image.getchannel('A').getextrema()[0] < 255:
+        return None
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    small = _flatten(image).resize((PLACEHOLDER_WIDTH, height), Image.LANCZOS).filter(ImageFilter.GaussianBlur(1))
+    data = _encode(small, 'WEBP', PLACEHOLDER_QUALITY)
+    return 'data:image/webp;base64,' + base64.b64encode(data).decode('ascii')
+
+def build_image(path, out_dir):
+    from PIL import Image, ImageOps
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with Image.open(path) as original:
+        image = _normalize(ImageOps.exif_transpose(original))
+
+    widths = [w for w in WIDTHS if w < image.width] + [min(image.width, WIDTHS[-1])]
+    variants = []
+    for width in sorted(set(widths)):
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.LANCZOS) if width != image.width else image
+        variants.append({
+            'width': width,
+            'height': height,
+            'webp': _write(out_dir, stem, width, 'webp', _encode(resized, 'WEBP', WEBP_QUALITY)),
+            'jpeg': _write(out_dir, stem, width, 'jpg', _encode(_flatten(resized), 'JPEG', JPEG_QUALITY)),
+        })
+    return {'variants': variants, 'placeholder': placeholder(image)}
+
+def build(src_dir=SOURCE_DIR, out_dir=OUTPUT_DIR, force=False, executor=None):
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    previous = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path) as f:
+            previous = json.load(f)
+
+    manifest = {}
+    stale = {}
+    for name in sorted(os.listdir(src_dir)):
+        path = os.path.join(src_dir, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, 'rb') as f:
+            source_hash = file_hash(f.read())
+        entry = previous.get(name)
+        if entry is None or entry['source'] != source_hash or 'placeholder' not in entry or not all(
+                os.path.exists(os.path.join(out_dir, v['webp'])) for v in entry['variants']):
+            stale[name] = source_hash
+        manifest[name] = entry
+
+    # Pillow releases the GIL while resizing and encoding, so a thread pool
+    # builds several images at once.
+    paths = [os.path.join(src_dir, name) for name in stale]
+    built = (executor.map if executor else map)(lambda path: build_image(path, out_dir), paths)
+    for (name, source_hash), images in zip(stale.items(), built):
+        manifest[name] = {'source': source_hash, **images}
+
+    keep = {MANIFEST}
+    for entry in manifest.values():
+        for variant in entry['variants']:
+            keep.update((variant['webp'], variant['jpeg']))
+    # The new manifest goes live before old variants are removed, and is
+    # renamed into place so a running server never reads half of it.
+    tmp = f'{manifest_path}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, manifest_path)
+
+    # Other profiles build into subdirectories of the default output directory.
+    for name in os.listdir(out_dir):
+        if name not in keep and os.path.isfile(os.path.join(out_dir, name)):
+            os.remove(os.path.join(out_dir, name))
+    return manifest
+
+def read_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def load_manifest(out_dir=OUTPUT_DIR):
+    # Keyed on the manifest's mtime, like content.load, so a build run by
+    # another process is picked up by a running server on its next render.
+    try:
+        mtime = os.stat(os.path.join(out_dir, MANIFEST)).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    return lru.shared.get_or_create(('manifest', out_dir, mtime), lambda: read_manifest(out_dir))
+
+def pick_variant(variants, width):
+    for variant in variants:
+        if variant['width'] >= width:
+            return variant
+    return variants[-1]
+
+def image_variant(name, width=COLUMN_WIDTH, out_dir=OUTPUT_DIR):
+    entry = load_manifest(out_dir).get(name)
+    if entry is None:
+        return None
+    return pick_variant(entry['variants'], width)
+
+def image_variants(name, out_dir=OUTPUT_DIR):
+    entry = load_manifest(out_dir).get(name)
+    return None if entry is None else entry['variants']
+
+def srcset(variants, fmt, url):
+    return ', '.join(f"{url}/{variant[fmt]} {variant['width']}w" for variant in variants)
+
+def image_placeholder(name, out_dir=OUTPUT_DIR):
+    entry = load_manifest(out_dir).get(name)
+    return None if entry is None else entry.get('placeholder')
+
+def image_path(name, width=COLUMN_WIDTH, src_dir=SOURCE_DIR, out_dir=OUTPUT_DIR):
+    variant = image_variant(name, width, out_dir)
+    if variant is None:
+        return os.path.join(src_dir, name)
+    return os.path.join(out_dir, variant['webp'])
+
+def report(src_dir, out_dir, manifest):
+    source_bytes = sum(os.path.getsize(os.path.join(src_dir, name)) for name in manifest)
+    largest = sum(os.path.getsize(os.path.join(out_dir, entry['variants'][-1]['webp'])) for entry in manifest.values())
+    print(f"{src_dir}: {len(manifest)} images, {source_bytes / 1024:.0f} KB originals, {largest / 1024:.0f} KB at the largest WebP bucket")
+
+def main():
+    import profiles
+
+    parser = argparse.ArgumentParser(description="Build resized WebP/JPEG variants of every profile's images.")
+    parser.add_argument('--src', help="build only this directory (default: image/ and every profile under profiles/)")
+    parser.add_argument('--out', default=OUTPUT_DIR, help="output directory for --src")
+    parser.add_argument('--force', action='store_true', help="rebuild every image even if its source is unchanged")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="images to build in parallel")
+    args = parser.parse_args()
+
+    if args.src:
+        dirs = [(args.src, args.out)]
+    else:
+        dirs = [(profile.image_dir, profile.out_dir) for profile in map(profiles.get, profiles.names())
+                if os.path.isdir(profile.image_dir)]
+    with ThreadPoolExecutor(args.jobs) as executor:
+        for src_dir, out_dir in dirs:
+            report(src_dir, out_dir, build(src_dir, out_dir, args.force, executor))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import hashlib
+import json
+import plotly.graph_objs as go
+import plotly.io as pio
+
+import disk_cache
+import lru
+
+# Only these template layout keys affect the bar, pie and scatter charts here;
+# colorscales, 3D scenes, maps and the like are dropped from every payload.
+TEMPLATE_LAYOUT = (
+    'autotypenumbers', 'colorway', 'font', 'hovermode', 'hoverlabel',
+    'paper_bgcolor', 'plot_bgcolor', 'title', 'xaxis', 'yaxis',
+)
+
+_templates = {}
+
+def slim_template(name, trace_types):
+    key = (name, trace_types)
+    template = _templates.get(key)
+    if template is None:
+        full = pio.templates[name].to_plotly_json()
+        template = {
+            'data': {kind: value for kind, value in full.get('data', {}).items() if kind in trace_types},
+            'layout': {key: value for key, value in full.get('layout', {}).items() if key in TEMPLATE_LAYOUT},
+        }
+        _templates[key] = template
+    return template
+
+def compact(fig, template):
+    # Swaps the full template for a slim one. The template must stay set:
+    # without it, st.plotly_chart re-validates the figure and applies the full
+    # default template again.
+    figure = fig.to_dict()
+    full_bytes = len(pio.to_json(figure, validate=False))
+    trace_types = tuple(sorted({trace['type'] for trace in figure['data']}))
+    figure['layout']['template'] = slim_template(template, trace_types)
+    # Only the sizes are kept: st.plotly_chart serializes the figure itself on
+    # every rerun, so a cached JSON string would just double each entry.
+    return {'figure': figure, 'bytes': len(to_json(figure)), 'full_bytes': full_bytes}
+
+def to_json(figure):
+    return pio.to_json(figure, validate=False)
+
+def data_hash(builder, data, template):
+    payload = json.dumps([builder.__name__, data, template], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def build_payload(builder, data, template):
+    entry = compact(builder(**data), template)
+    entry.update(name=builder.__name__, template=template)
+    return entry
+
+def shared_payload(builder, data, template, key):
+    # With several workers, the first one to need a figure builds it and the
+    # rest load its serialized payload from the shared disk cache.
+    if not disk_cache.CACHE_DIR:
+        return build_payload(builder, data, template)
+
+    def create():
+        return to_json(build_payload(builder, data, template)).encode('utf-8')
+
+    return json.loads(disk_cache.get_or_create('figure', key, create))
+
+def cached_payload(builder, data, template=None):
+    # Figures are built once and shared by every session and every profile with
+    # the same chart data. The key is a hash of the builder name, its input
+    # data and the template, so editing the chart data produces a new entry
+    # instead of serving a stale figure.
+    #
+    # Streamlit registers its own "streamlit" template as the default, and the
+    # frontend fills in its placeholder colors; the static export asks for
+    # "plotly" instead.
+    template = template or pio.templates.default
+    key = data_hash(builder, data, template)
+    return lru.shared.get_or_create(('figure', key), lambda: shared_payload(builder, data, template, key))
+
+def cached_figure(builder, data, template=None):
+    return cached_payload(builder, data, template)['figure']
+
+def payload_sizes():
+    return {
+        f"{entry['name']} ({entry['template']})": {'bytes': entry['bytes'], 'full_bytes': entry['full_bytes']}
+        for entry in lru.shared.values('figure')
+    }
+
+def company_plot(companies, months, intervals):
+    fig = go.Figure()
+    for i in range(len(companies)):
+        fig.add_trace(go.Bar(
+            y=[companies[i]],
+            x=[months[i]],
+            orientation='h',
+            text=intervals[i], 
+            textposition='inside', 
+            hoverinfo='none',
+            showlegend=False
+        ))
+
+    fig.update_layout(
+        title="Internship Experience",
+        xaxis_title="Number of Months",
+        modebar_remove=['lasso', 'select','toimage', 'pan'],
+        height=500,
+        font=dict(size=20), 
+        yaxis=dict(tickfont=dict(size=20)),
+        title_font=dict(size=20)
+    )
+    return fig
+
+def tools_plot(tools, projects):
+    fig = go.Figure(go.Pie(
+        labels=tools,
+        values=projects,
+        textinfo='label+percent', 
+    ))
+    fig.update_traces(
+        textfont=dict(size=20), 
+        hoverinfo='none'  
+    )
+    fig.update_layout(
+        height=500,
+        title='Project-Based Tool Experience Distribution',
+        title_font=dict(size=20),
+        showlegend=False
+    )
+    return fig
+
+def cgpa_plot(years, courses_taken, cgpa):
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=years,
+        y=courses_taken,
+        name='Courses Taken',
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=cgpa,
+        mode='lines+markers',
+        name='CGPA',
+        yaxis='y2', 
+        line=dict(color='#EF553B', width=2)
+    ))
+
+    fig.update_layout(
+        height=500,
+        title='CGPA Through The Semesters',
+        modebar_remove=['lasso', 'select','toimage', 'pan'],
+        xaxis=dict(title='Year-Semester',tickfont=dict(size=20)),
+        yaxis=dict(title='Number of Courses Taken'),
+        yaxis2=dict(title='Cumulative GPA', overlaying='y', side='right'),
+        legend=dict(x=0, y=1.1),
+        title_font=dict(size=20)
+    )
+    return fig
+
+def language_plot(languages, levels):
+    fig = go.Figure(go.Bar(
+        x=levels,
+        y=languages,
+        orientation='h'
+    ))
+
+    fig.update_layout(
+        title='Language Proficiency',
+        modebar_remove=['lasso', 'select','toimage', 'pan'],
+        height=500,
+        xaxis=dict(tickvals=[0, 1, 2, 3, 4, 5], ticktext=["None", "Elementary", "Limited", "Professional", "Full Professional", "Native"]),
+        yaxis=dict(tickfont=dict(size=20)),
+        title_font=dict(size=20)
+    )
+    return fig
+
+def mbti_plot(categories, subcategories, values):
+    category_order = ['Energy', 'Mind', 'Nature', 'Tactics', 'Identity']
+
+    fig = go.Figure()
+    for i in range(len(subcategories)):
+        fig.add_trace(go.Bar(
+            y=[categories[i]],
+            x=[values[i]],
+            name=subcategories[i],
+            orientation='h',
+            text=[f"{subcategories[i]}  {values[i]}"],
+            textfont=dict(size=15)
+        ))
+
+    fig.update_layout(
+        title='',
+        barmode='relative',
+        margin=dict(t=60),
+        modebar_remove=['lasso', 'select','toimage', 'pan'],
+        title_font=dict(size=20),
+        hovermode=False, 
+        xaxis_visible=False, 
+        yaxis=dict(visible=False, categoryorder='array', categoryarray=category_order[::-1]),
+        showlegend=False,)
+    return fig
@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+# Runs several Streamlit workers for main.py behind a small sticky-session
+# proxy, so script runs are spread over more than one core:
+#
+#   python cluster.py --workers 4 --port 8080
+#
+# A Streamlit session lives on its websocket, in the worker that accepted it,
+# so a visitor must keep reaching the same worker. The proxy pins each new
+# visitor to the worker with the fewest open connections and sets a cookie
+# naming it; requests carrying the cookie go back to that worker. One TCP
+# connection always stays on one worker.
+#
+# The launcher warms up once before starting the workers: image variants are
+# built into static/img and figure payloads are written to the shared disk
+# cache (RESUME_DISK_CACHE, see disk_cache.py), so they are built once per
+# machine and the workers only read them.
+# Any other arguments are passed to every worker's `streamlit run`.
+DISK_CACHE = os.path.join('.cache', 'resume')
+COOKIE = b'resume_worker'
+CHUNK = 64 * 1024
+
+def wait_healthy(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f'{url}/_stcore/health', timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not become healthy within {timeout}s")
+
+class Proxy:
+    def __init__(self, ports):
+        self.ports = ports
+        self.connections = [0] * len(ports)
+
+    def pick(self, head):
+        # Returns the worker for this connection and whether it is newly chosen.
+        for line in head.split(b'\r\n')[1:]:
+            name, _, value = line.partition(b':')
+            if name.strip().lower() != b'cookie':
+                continue
+            for cookie in value.split(b';'):
+                key, _, worker = cookie.strip().partition(b'=')
+                if key == COOKIE and worker.isdigit() and int(worker) < len(self.ports):
+                    return int(worker), False
+        return min(range(len(self.ports)), key=self.connections.__getitem__), True
+
+    async def pipe(self, reader, writer, cookie=None):
+        try:
+            if cookie is not None:
+                head = await reader.readuntil(b'\r\n\r\n')
+                writer.write(head[:-2] + b'Set-Cookie: ' + cookie + b'\r\n\r\n')
+            while data := await reader.read(CHUNK):
+                writer.write(data)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle(self, client_reader, client_writer):
+        try:
+            head = await client_reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            return
+        worker, new = self.pick(head)
+        self.connections[worker] += 1
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection('127.0.0.1', self.ports[worker])
+        except OSError:
+            self.connections[worker] -= 1
+            client_writer.close()
+            return
+        cookie = COOKIE + b'=%d; Path=/; HttpOnly; SameSite=Lax' % worker if new else None
+        upstream_writer.write(head)
+        try:
+            await asyncio.gather(
+                self.pipe(client_reader, upstream_writer),
+                self.pipe(upstream_reader, client_writer, cookie),
+            )
+        finally:
+            self.connections[worker] -= 1
+
+async def serve(proxy, host, port):
+    server = await asyncio.start_server(proxy.handle, host, port)
+    async with server:
+        await server.serve_forever()
+
+def start_workers(count, base_port, streamlit_args):
+    workers = []
+    for i in range(count):
+        command = [
+            sys.executable, 'serve.py', '--warmup', '--no-build-images',
+            '--server.port', str(base_port + i),
+            '--server.headless', 'true',
+            *streamlit_args,
+        ]
+        workers.append(subprocess.Popen(command))
+    return workers
+
+def main():
+    parser = argparse.ArgumentParser(description="Run several Streamlit workers for main.py behind a sticky-session proxy.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080, help="port the proxy listens on")
+    parser.add_argument('--base-port', type=int, default=8501, help="workers listen on consecutive ports from here")
+    args, streamlit_args = parser.parse_known_args()
+
+    # Stopping the launcher stops its workers too.
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    os.environ.setdefault('RESUME_DISK_CACHE', DISK_CACHE)
+    import disk_cache
+    import warmup
+
+    # Starts from an empty cache so entries for superseded data don't pile up.
+    disk_cache.clear()
+
+    start = time.perf_counter()
+    warmup.warm_up()
+    print(f"Shared warm-up finished in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    ports = [args.base_port + i for i in range(args.workers)]
+    workers = start_workers(args.workers, args.base_port, streamlit_args)
+    try:
+        for port in ports:
+            wait_healthy(f'http://127.0.0.1:{port}')
+        print(f"{args.workers} workers behind http://{args.host}:{args.port}", file=sys.stderr)
+        asyncio.run(serve(Proxy(ports), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import json
+import os
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+import lru
+
+DATA_FILE = os.path.join('data', 'resume.json')
+
+class Record(dict):
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("resume content is read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+def freeze(value):
+    if isinstance(value, dict):
+        return Record((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def parse(path):
+    with open(path, encoding='utf-8') as f:
+        return freeze(json.load(f))
+
+def load(path=DATA_FILE):
+    # The parsed data file is shared by every session. It is re-read only when
+    # the file's mtime changes, so content edits go live without a restart or
+    # deploy, and it may be evicted from the shared cache when unused.
+    mtime = os.stat(path).st_mtime_ns
+    key = ('content', path, mtime)
+    return lru.shared.get_or_create(key, lambda: parse(path))
+
+# Link targets in the data file may only open web pages or mail, or be
+# relative; anything else, like javascript:, is replaced.
+LINK_SCHEMES = ('', 'http', 'https', 'mailto')
+
+def safe_url(url):
+    url = url.strip()
+    return url if urlsplit(url).scheme in LINK_SCHEMES else '#'
+
+@lru_cache(maxsize=256)
+def bullets(items):
+    return "\n".join(f"- {item}" for item in items)
@@ -0,0 +1,66 @@
+import fcntl
+import os
+import shutil
+
+import metrics
+
+# An on-disk cache shared by every worker on the machine, used when the app
+# runs as several processes (see cluster.py). Each entry is one file, written
+# once under an exclusive lock and renamed into place, so an entry is built
+# by a single worker, once per machine, and the others read it. Each worker
+# still keeps its own parsed copy in memory. Keys are content hashes, so
+# entries for old data are never read again; cluster.py clears the directory
+# on start. Unset RESUME_DISK_CACHE to keep everything in process memory only.
+CACHE_DIR = os.environ.get('RESUME_DISK_CACHE')
+
+# The subdirectories this module writes; clear() removes only these, since
+# RESUME_DISK_CACHE may point at a directory shared with other programs.
+KINDS = ('figure',)
+
+def path(kind, key):
+    return os.path.join(CACHE_DIR, kind, key)
+
+def read(filename):
+    try:
+        with open(filename, 'rb') as f:
+            return f.read() or None
+    except FileNotFoundError:
+        return None
+
+def write(filename, data):
+    tmp = f'{filename}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, filename)
+
+def clear():
+    for kind in KINDS:
+        shutil.rmtree(os.path.join(CACHE_DIR, kind), ignore_errors=True)
+
+def get_or_create(kind, key, create):
+    # create() returns bytes. Keys must be safe file names, e.g. hex digests.
+    assert kind in KINDS, kind
+    filename = path(kind, key)
+    data = read(filename)
+    if data is None:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        lock_name = f'{filename}.lock'
+        with open(lock_name, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            data = read(filename)
+            built = data is None
+            if built:
+                data = create()
+                write(filename, data)
+            # The entry exists now, so the lock is no longer needed: anyone
+            # still waiting on it finds the entry once they get it, and later
+            # callers find it before locking.
+            try:
+                os.remove(lock_name)
+            except FileNotFoundError:
+                pass
+        if built:
+            metrics.count('disk_cache_lookups', kind=kind, result='miss')
+            return data
+    metrics.count('disk_cache_lookups', kind=kind, result='hit')
+    return data
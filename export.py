@@ -0,0 +1,359 @@
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+from datetime import datetime
+
+import content
+import profiles
+import search
+import timebucket
+from assets import (COLUMN_SIZES, COLUMN_WIDTH, MANIFEST, SIDEBAR_SIZES, SIDEBAR_WIDTH, file_hash, image_path,
+                    image_placeholder, image_variants, pick_variant, srcset)
+from charts import cached_figure, company_plot, tools_plot, cgpa_plot, language_plot, mbti_plot, to_json
+from sections.hobby import get_streak
+
+OUTPUT_DIR = 'site'
+
+# Records, for each exported page, the data it was built from and when it goes
+# stale. A page showing date-dependent values expires at the end of their time
+# bucket; any other page stays valid until the data or images change.
+STATE = 'export.json'
+
+# Same labels as the sidebar selectbox in main.py, mapped to output files.
+PAGES = {
+    'Home': 'index.html',
+    'Work Experience': 'work.html',
+    'Education': 'education.html',
+    'Hobbies': 'hobbies.html',
+}
+
+STYLE = """
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #31333f; }
+.sidebar { position: fixed; top: 0; bottom: 0; left: 0; width: 300px; padding: 2rem 1.5rem; overflow-y: auto; background: #f0f2f6; box-sizing: border-box; }
+.sidebar img.photo { width: 100%; height: auto; }
+.sidebar nav a { display: block; padding: .3rem 0; }
+.sidebar nav a.current { font-weight: 600; }
+main { margin-left: 300px; padding: 3rem 4rem; max-width: 46rem; }
+.columns { display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; align-items: start; }
+.columns img { width: 100%; height: auto; }
+figure { margin: 0; }
+figcaption { font-size: .875rem; color: #808495; text-align: center; }
+hr { border: none; border-top: 1px solid #e6e6e6; margin: 2rem 0; }
+.right { text-align: right; }
+.center { text-align: center; }
+"""
+
+FILTER_SCRIPT = """
+var select = document.getElementById('tool');
+function filterProjects() {
+    document.querySelectorAll('.project').forEach(function (project) {
+        project.hidden = select.value !== '' && project.dataset.tools.split('|').indexOf(select.value) < 0;
+    });
+}
+select.addEventListener('change', filterProjects);
+filterProjects();
+"""
+
+BOLD = re.compile(r'\*\*(.+?)\*\*')
+LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+def emphasis(text):
+    return BOLD.sub(r'<strong>\1</strong>', html.escape(text, quote=False))
+
+def inline(text):
+    # Links are found in the raw text so the label and the target are each
+    # escaped exactly once.
+    parts = []
+    end = 0
+    for match in LINK.finditer(text):
+        parts.append(emphasis(text[end:match.start()]))
+        parts.append(f'<a href="{html.escape(content.safe_url(match.group(2)))}">{emphasis(match.group(1))}</a>')
+        end = match.end()
+    parts.append(emphasis(text[end:]))
+    return ''.join(parts)
+
+def markdown(text):
+    # Covers the subset the data file uses: paragraphs, "- " bullet lists,
+    # **bold** and [links](url).
+    parts = []
+    items = []
+    for line in text.split('\n'):
+        if line.startswith('- '):
+            items.append(f"<li>{inline(line[2:])}</li>")
+            continue
+        if items:
+            parts.append(f"<ul>{''.join(items)}</ul>")
+            items = []
+        if line.strip():
+            parts.append(f"<p>{inline(line)}</p>")
+    if items:
+        parts.append(f"<ul>{''.join(items)}</ul>")
+    return '\n'.join(parts)
+
+class Exporter:
+    def __init__(self, out_dir, profile):
+        self.out_dir = out_dir
+        self.profile = profile
+        self.charts = 0
+
+    def copy(self, source):
+        target = os.path.join('img', os.path.basename(source))
+        destination = os.path.join(self.out_dir, target)
+        if not os.path.exists(destination):
+            shutil.copyfile(source, destination)
+        return target
+
+    def image(self, name, width=COLUMN_WIDTH, caption=None, lazy=True, sizes=COLUMN_SIZES):
+        attributes = ''
+        source = None
+        variants = image_variants(name, self.profile.out_dir)
+        if variants is None:
+            src = self.copy(image_path(name, width, self.profile.image_dir, self.profile.out_dir))
+        else:
+            # Every bucket is copied so the browser can pick the smallest one
+            # that fits, as in the app; the JPEGs are the fallback for
+            # browsers without WebP support.
+            for variant in variants:
+                self.copy(os.path.join(self.profile.out_dir, variant['webp']))
+                self.copy(os.path.join(self.profile.out_dir, variant['jpeg']))
+            variant = pick_variant(variants, width)
+            src = f"img/{variant['jpeg']}"
+            source = f'<source type="image/webp" srcset="{html.escape(srcset(variants, "webp", "img"))}" sizes="{sizes}">'
+            # The size attributes reserve the box before the image arrives.
+            attributes += (f' srcset="{html.escape(srcset(variants, "jpeg", "img"))}" sizes="{sizes}"'
+                           f' width="{variant["width"]}" height="{variant["height"]}"')
+        if lazy:
+            # Same as the app: fetched near the viewport, blurred placeholder until then.
+            attributes += ' loading="lazy" decoding="async"'
+            placeholder = image_placeholder(name, self.profile.out_dir)
+            if placeholder:
+                attributes += f' style="background: url({placeholder}) center / cover no-repeat"'
+        tag = f'<img src="{html.escape(src)}"{attributes} alt="{html.escape(caption or name)}">'
+        if source:
+            tag = f'<picture>{source}{tag}</picture>'
+        if caption:
+            return f"<figure>{tag}<figcaption>{html.escape(caption)}</figcaption></figure>"
+        return tag
+
+    def chart(self, builder, data):
+        self.charts += 1
+        chart_id = f"chart-{self.charts}"
+        # The static pages have no Streamlit frontend to fill in the
+        # "streamlit" template's placeholder colors, so use Plotly's own.
+        figure = to_json(cached_figure(builder, data, 'plotly'))
+        return (f'<div id="{chart_id}"></div>\n'
+                f'<script>var figure = {figure}; Plotly.newPlot("{chart_id}", figure.data, figure.layout, {{"displaylogo": false, "responsive": true}});</script>')
+
+    def home(self, data):
+        page = data.home
+        charts = data.charts
+        mbti = page.mbti
+        return '\n'.join([
+            f"<h1>{html.escape(page.title)}</h1>",
+            f"<h2>{html.escape(page.header)}</h2>",
+            *(f"<h5>{html.escape(highlight)}</h5>" for highlight in page.highlights),
+            "<hr>",
+            f"<h2>{html.escape(page.summary)}</h2>",
+            self.chart(company_plot, charts.company),
+            "<hr>",
+            self.chart(tools_plot, charts.tools),
+            f"<p>{html.escape(page.tools_caption)}</p>",
+            "<hr>",
+            self.chart(cgpa_plot, charts.cgpa),
+            "<hr>",
+            self.chart(language_plot, charts.language),
+            "<hr>",
+            '<div class="columns"><div>',
+            "<h4>Myers–Briggs Type Indicator (MBTI)</h4>",
+            markdown(mbti.intro),
+            markdown(content.bullets(mbti.traits)),
+            markdown(mbti.link),
+            f"</div><div><br>{self.image(mbti.image)}</div></div>",
+            "<h5>Test results and interpretation</h5>",
+            f'<div class="columns"><div>{markdown(content.bullets(mbti.results))}</div>',
+            f"<div>{self.chart(mbti_plot, charts.mbti)}</div></div>",
+        ])
+
+    def work(self, data):
+        parts = ["<h1>Work Experience</h1>"]
+        for i, job in enumerate(data.work):
+            if i:
+                parts.append("<hr>")
+            parts += [
+                f"<h2>{html.escape(job.company)}</h2>",
+                '<div class="columns"><div>',
+                f"<h3>{html.escape(job.role)}</h3>",
+                "<h4>Accomplishment</h4>",
+                markdown(content.bullets(job.accomplishments)),
+                "<h4>Tools</h4>",
+                markdown(content.bullets(job.tools)),
+                f'</div><div><h3 class="right">{html.escape(job.period)}</h3><br>{self.image(job.image, lazy=i > 0)}</div></div>',
+            ]
+        return '\n'.join(parts)
+
+    def project(self, item, lazy=True):
+        text = []
+        if 'title' in item:
+            text.append(f"<h4>{html.escape(item.title)}</h4>")
+        if 'intro' in item:
+            text.append(markdown(item.intro))
+        text.append(markdown(content.bullets(item.bullets)))
+        parts = [f'<section class="project" data-tools="{html.escape("|".join(item.tools))}">']
+        if 'group' in item:
+            parts.append(f"<h3>{html.escape(item.group)}</h3>")
+        parts.append(f"<h3>{html.escape(item.heading)}</h3>")
+        if 'image' in item:
+            parts.append(f'<div class="columns"><div>{"".join(text)}</div><div>{self.image(item.image, lazy=lazy)}</div></div>')
+        else:
+            parts += text
+        parts.append("<hr></section>")
+        return '\n'.join(parts)
+
+    def education(self, data):
+        page = data.education
+        default = page.default_tools[0] if page.default_tools else ''
+        options = '<option value="">All tools</option>' + ''.join(
+            f'<option{" selected" if tool == default else ""}>{html.escape(tool)}</option>'
+            for tool in search.project_index(page.projects).options('tools')
+        )
+        # The first image shown under the default filter is usually in view on
+        # load, so only the rest are lazy.
+        first = next((i for i, item in enumerate(page.projects)
+                      if 'image' in item and (not default or default in item.tools)), None)
+        return '\n'.join([
+            "<h1>Education</h1>",
+            f"<h2>{html.escape(page.school)}</h2>",
+            f"<h3>{html.escape(page.degree)}</h3>",
+            markdown(content.bullets(page.details)),
+            "<hr>",
+            "<h2>Projects</h2>",
+            f'<label>Filter projects by tool used <select id="tool">{options}</select></label>',
+            *(self.project(item, lazy=i != first) for i, item in enumerate(page.projects)),
+            f"<script>{FILTER_SCRIPT}</script>",
+        ])
+
+    def hobby(self, data):
+        streak = get_streak(data.streak.start, data.streak.days)
+        parts = ["<h1>Hobbies</h1>"]
+        for i, item in enumerate(data.hobbies):
+            if i:
+                parts.append("<hr>")
+            bullets = tuple(bullet.replace('{streak}', str(streak)) for bullet in item.bullets)
+            parts += [
+                f"<h3>{html.escape(item.heading)}</h3>",
+                f'<div class="columns"><div>{markdown(content.bullets(bullets))}</div>',
+                f"<div>{self.image(item.image, caption=item.caption, lazy=i > 0)}</div></div>",
+            ]
+        return '\n'.join(parts)
+
+    def sidebar(self, profile, current):
+        links = ''.join(
+            f'<a href="{filename}"{" class=current" if label == current else ""}>{label}</a>'
+            for label, filename in PAGES.items()
+        )
+        return f"""<aside class="sidebar">
+{self.image(profile.photo, SIDEBAR_WIDTH, lazy=False, sizes=SIDEBAR_SIZES).replace('<img ', '<img class="photo" ', 1)}
+<h1 class="center">{html.escape(profile.name)}</h1>
+<p class="center">{html.escape(profile.tagline)}</p>
+<p class="center"><a href="mailto:{html.escape(profile.email)}">Email</a> · <a href="{html.escape(content.safe_url(profile.linkedin))}">LinkedIn</a></p>
+<hr>
+<h2>Navigate</h2>
+<nav>{links}</nav>
+</aside>"""
+
+    def page(self, data, label, body):
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(data.profile.name)} · {label}</title>
+<style>{STYLE}</style>
+<script src="plotly.min.js"></script>
+</head>
+<body>
+{self.sidebar(data.profile, label)}
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+    def export(self, data, source=None, cached=None):
+        # cached maps output files from an earlier export of the same source
+        # to their expiry; pages that are still fresh are not rendered again.
+        cached = cached or {}
+        os.makedirs(os.path.join(self.out_dir, 'img'), exist_ok=True)
+        renderers = {
+            'Home': self.home,
+            'Work Experience': self.work,
+            'Education': self.education,
+            'Hobbies': self.hobby,
+        }
+        written = []
+        pages = {}
+        for label, filename in PAGES.items():
+            path = os.path.join(self.out_dir, filename)
+            if filename in cached and os.path.exists(path) and fresh(cached[filename]):
+                pages[filename] = cached[filename]
+                continue
+            with timebucket.track() as expiry:
+                page = self.page(data, label, renderers[label](data))
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(page)
+            pages[filename] = expiry.at and expiry.at.isoformat()
+            written.append(path)
+
+        script = os.path.join(self.out_dir, 'plotly.min.js')
+        if written or not os.path.exists(script):
+            import plotly.offline
+            with open(script, 'w', encoding='utf-8') as f:
+                f.write(plotly.offline.get_plotlyjs())
+        with open(os.path.join(self.out_dir, STATE), 'w') as f:
+            json.dump({'source': source, 'pages': pages}, f, indent=1)
+        return written
+
+def fresh(expires):
+    return expires is None or timebucket.now() < datetime.fromisoformat(expires)
+
+def source_hash(profile):
+    # The pages embed the data and the image variant names, so either changing
+    # invalidates every page.
+    digest = []
+    for path in (profile.data_file, os.path.join(profile.out_dir, MANIFEST)):
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.append(file_hash(f.read()))
+    return '-'.join(digest)
+
+def previous_pages(out_dir, source):
+    try:
+        with open(os.path.join(out_dir, STATE)) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return state['pages'] if state.get('source') == source else {}
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every page of the resume to static HTML.")
+    parser.add_argument('--out', default=OUTPUT_DIR)
+    parser.add_argument('--profile', default=profiles.DEFAULT, choices=profiles.names())
+    parser.add_argument('--if-stale', action='store_true',
+                        help="only re-export pages whose data changed or whose date-dependent values expired")
+    args = parser.parse_args()
+
+    profile = profiles.get(args.profile)
+    source = source_hash(profile)
+    cached = previous_pages(args.out, source) if args.if_stale else None
+    written = Exporter(args.out, profile).export(profile.load(), source, cached)
+    for path in written:
+        print(f"{path}  {os.path.getsize(path) / 1024:.0f} KB")
+    if not written:
+        print("Every page is up to date.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import metrics
+
+# One bounded cache holds everything built per profile: parsed content,
+# figures, search indexes and image manifests. Least recently used entries are
+# evicted once the estimated total goes over RESUME_CACHE_MB, so memory stays
+# flat however many profiles are served.
+MAX_BYTES = int(float(os.environ.get('RESUME_CACHE_MB', '64')) * 1024 * 1024)
+
+def approx_size(value, seen=None):
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approx_size(key, seen) + approx_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(item, seen) for item in value)
+    elif hasattr(value, '__dict__'):
+        size += approx_size(vars(value), seen)
+    return size
+
+class LRUCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._building = {}
+
+    def get(self, key):
+        # Keys are tuples whose first item names the kind of entry.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        metrics.count('cache_lookups', kind=key[0], result='miss' if entry is None else 'hit')
+        return None if entry is None else entry[0]
+
+    def put(self, key, value):
+        size = approx_size(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            # The newest entry is never evicted, even if it alone is over the cap.
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return value
+
+    def pop(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry[1]
+
+    def get_or_create(self, key, create):
+        value = self.get(key)
+        if value is not None:
+            return value
+        # Concurrent misses on the same key wait for one build instead of
+        # each building their own copy.
+        with self._lock:
+            lock = self._building.setdefault(key, threading.Lock())
+        with lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None:
+                return entry[0]
+            try:
+                return self.put(key, create())
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+
+    def values(self, kind):
+        with self._lock:
+            return [value for key, (value, _) in self._entries.items() if key[0] == kind]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+shared = LRUCache(MAX_BYTES)
@@ -0,0 +1,102 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Timings and counters are process-wide, shared by every session. Set
+# RESUME_METRICS_FILE to have them written out every RESUME_METRICS_INTERVAL
+# seconds: a path ending in .prom gets Prometheus text (for node_exporter's
+# textfile collector), anything else gets JSON. RESUME_DEBUG=1 enables the
+# sidebar debug panel behind ?debug=1.
+METRICS_FILE = os.environ.get('RESUME_METRICS_FILE')
+INTERVAL = float(os.environ.get('RESUME_METRICS_INTERVAL', '15'))
+DEBUG = os.environ.get('RESUME_DEBUG') == '1'
+
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_timings = {}
+_counters = {}
+_lock = threading.Lock()
+_writer = None
+
+def observe(section, seconds):
+    with _lock:
+        timing = _timings.get(section)
+        if timing is None:
+            timing = _timings[section] = {'count': 0, 'sum': 0.0, 'max': 0.0, 'buckets': [0] * len(BUCKETS)}
+        timing['count'] += 1
+        timing['sum'] += seconds
+        timing['max'] = max(timing['max'], seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                timing['buckets'][i] += 1
+
+@contextmanager
+def timer(section):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(section, time.perf_counter() - start)
+
+def count(name, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + 1
+
+def trigger(widget):
+    # Used as a widget on_change callback, so it runs once per user change.
+    count('widget_triggers', widget=widget)
+
+def snapshot():
+    with _lock:
+        timings = {section: dict(timing, buckets=list(timing['buckets'])) for section, timing in _timings.items()}
+        counters = [{'name': name, 'labels': dict(labels), 'value': value} for (name, labels), value in _counters.items()]
+    return {'timestamp': time.time(), 'timings': timings, 'counters': counters}
+
+def _labels(labels):
+    return ','.join(f'{key}="{value}"' for key, value in labels.items())
+
+def prometheus(data=None):
+    data = data or snapshot()
+    lines = [
+        '# HELP resume_render_seconds Time spent rendering a page, chart or image.',
+        '# TYPE resume_render_seconds histogram',
+    ]
+    for section, timing in sorted(data['timings'].items()):
+        for bound, value in zip(BUCKETS, timing['buckets']):
+            lines.append(f'resume_render_seconds_bucket{{section="{section}",le="{bound}"}} {value}')
+        lines.append(f'resume_render_seconds_bucket{{section="{section}",le="+Inf"}} {timing["count"]}')
+        lines.append(f'resume_render_seconds_sum{{section="{section}"}} {timing["sum"]:.6f}')
+        lines.append(f'resume_render_seconds_count{{section="{section}"}} {timing["count"]}')
+
+    names = sorted({counter['name'] for counter in data['counters']})
+    for name in names:
+        lines.append(f'# TYPE resume_{name}_total counter')
+        for counter in data['counters']:
+            if counter['name'] == name:
+                lines.append(f'resume_{name}_total{{{_labels(counter["labels"])}}} {counter["value"]}')
+    return '\n'.join(lines) + '\n'
+
+def write(path=METRICS_FILE):
+    data = snapshot()
+    output = prometheus(data) if path.endswith('.prom') else json.dumps(data, indent=1)
+    # Write then rename so a scraper never reads a half-written file.
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(output)
+    os.replace(tmp, path)
+
+def _write_forever():
+    while True:
+        time.sleep(INTERVAL)
+        write()
+
+def start_writer():
+    global _writer
+    if METRICS_FILE and _writer is None:
+        with _lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_write_forever, name='metrics-writer', daemon=True)
+                _writer.start()
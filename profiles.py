@@ -0,0 +1,54 @@
+import os
+import re
+
+import assets
+import content
+
+# Each resume served by this app is a profile, picked with ?profile=<name>.
+# The default profile is the one at the top of the repository; every other
+# profile is a directory under profiles/ with its own data file and images:
+#
+#   profiles/<name>/resume.json
+#   profiles/<name>/image/
+#
+# Image variants for a profile are built into static/img/<name>/.
+PROFILES_DIR = 'profiles'
+DEFAULT = 'default'
+
+NAME = re.compile(r'^[a-z0-9][a-z0-9_-]{0,63}$')
+
+class Profile:
+    def __init__(self, name):
+        self.name = name
+        if name == DEFAULT:
+            self.data_file = content.DATA_FILE
+            self.image_dir = assets.SOURCE_DIR
+            self.out_dir = assets.OUTPUT_DIR
+            self.url = assets.STATIC_URL
+        else:
+            self.data_file = os.path.join(PROFILES_DIR, name, 'resume.json')
+            self.image_dir = os.path.join(PROFILES_DIR, name, 'image')
+            self.out_dir = os.path.join(assets.OUTPUT_DIR, name)
+            self.url = f'{assets.STATIC_URL}/{name}'
+
+    def load(self):
+        return content.load(self.data_file)
+
+    def __repr__(self):
+        return f'Profile({self.name!r})'
+
+def get(name=DEFAULT):
+    # Names come straight from the query string, so only plain directory names
+    # are accepted and nothing outside profiles/ can be reached.
+    if name != DEFAULT and not NAME.match(name or ''):
+        return None
+    profile = Profile(name)
+    if not os.path.isfile(profile.data_file):
+        return None
+    return profile
+
+def names():
+    found = [DEFAULT]
+    if os.path.isdir(PROFILES_DIR):
+        found += sorted(name for name in os.listdir(PROFILES_DIR) if name != DEFAULT and get(name))
+    return found
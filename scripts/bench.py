@@ -0,0 +1,164 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+# The app's own modules are imported inside the functions that need them, so
+# a --cold-child process only imports them while its timer runs.
+APP = os.path.join(ROOT, 'main.py')
+SEARCH_QUERIES = ['python', 'machine learning', 'flutter']
+
+def new_app(page):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=120)
+    app.query_params['page'] = page
+    return app
+
+def timed_run(app):
+    start = time.perf_counter()
+    app.run()
+    elapsed = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(app.exception[0].value)
+    return elapsed * 1000
+
+def summarize(samples):
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'min_ms': round(min(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'runs': len(samples),
+    }
+
+def cold_run(page):
+    # A fresh interpreter, so imports and every process-wide cache are cold.
+    result = subprocess.run(
+        [sys.executable, __file__, '--cold-child', page],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+def bench_pages(runs):
+    from main import PAGES
+
+    results = {}
+    for label, page in PAGES.items():
+        cold = [cold_run(page) for _ in range(max(1, runs // 5))]
+        app = new_app(page)
+        timed_run(app)
+        tracemalloc.start()
+        warm = [timed_run(app) for _ in range(runs)]
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[label] = {
+            'cold': summarize([c['ms'] for c in cold]),
+            'warm': summarize(warm),
+            'cold_peak_rss_kb': max(c['peak_rss_kb'] for c in cold),
+            'warm_peak_alloc_kb': round(peak / 1024, 1),
+        }
+    return results
+
+def bench_education_filter(runs):
+    app = new_app('education')
+    timed_run(app)
+    results = {}
+    for tool in app.main.multiselect[0].options:
+        samples = []
+        for _ in range(runs):
+            app.main.multiselect[0].set_value([tool])
+            samples.append(timed_run(app))
+        results[tool] = summarize(samples)
+    app.main.multiselect[0].set_value([])
+    for query in SEARCH_QUERIES:
+        samples = []
+        for _ in range(runs):
+            app.main.text_input[0].set_value(query)
+            samples.append(timed_run(app))
+        results[f'search:{query}'] = summarize(samples)
+    return results
+
+def bench_search(runs):
+    import content
+    import search
+
+    index = search.ProjectIndex(content.load().education.projects)
+    results = {}
+    for query in SEARCH_QUERIES:
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            index.search(query)
+            samples.append((time.perf_counter() - start) * 1000)
+        results[query] = summarize(samples)
+    return results
+
+def bench_figures(runs):
+    import content
+    from charts import cached_payload, company_plot, tools_plot, cgpa_plot, language_plot, mbti_plot
+
+    charts = content.load().charts
+    builders = {
+        'company_plot': (company_plot, charts.company),
+        'tools_plot': (tools_plot, charts.tools),
+        'cgpa_plot': (cgpa_plot, charts.cgpa),
+        'language_plot': (language_plot, charts.language),
+        'mbti_plot': (mbti_plot, charts.mbti),
+    }
+    results = {}
+    for name, (builder, data) in builders.items():
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            builder(**data).to_dict()
+            samples.append((time.perf_counter() - start) * 1000)
+        payload = cached_payload(builder, data)
+        results[name] = dict(summarize(samples), payload_bytes=payload['bytes'], full_bytes=payload['full_bytes'])
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page reruns, figure builds and memory headlessly with AppTest.")
+    parser.add_argument('--runs', type=int, default=20, help="warm reruns per measurement")
+    parser.add_argument('--out', help="write the JSON report here instead of stdout")
+    parser.add_argument('--cold-child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_child:
+        # Timed from before streamlit, main and the page modules are imported.
+        start = time.perf_counter()
+        timed_run(new_app(args.cold_child))
+        ms = (time.perf_counter() - start) * 1000
+        print(json.dumps({'ms': ms, 'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+        return
+
+    import streamlit
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'pages': bench_pages(args.runs),
+        'education_filter': bench_education_filter(args.runs),
+        'search': bench_search(args.runs),
+        'figures': bench_figures(args.runs),
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budgets are in milliseconds of import time on top of `import streamlit`,
+# which every page pays regardless. Raise a budget only together with the
+# change that justifies it.
+BUDGETS = {
+    'main': 15,
+    'charts': 25,
+    'sections.home': 30,
+    'sections.work': 15,
+    'sections.education': 15,
+    'sections.hobby': 15,
+}
+
+# Importing any of these from a page module is a regression on its own.
+FORBIDDEN = ['pandas', 'plotly.express']
+
+LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+def measure(module):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import streamlit; import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    total = 0
+    imported = []
+    seen_streamlit = False
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        if not seen_streamlit:
+            seen_streamlit = name == 'streamlit' and indent == ' '
+            continue
+        imported.append(name)
+        if indent == ' ':
+            total += int(cumulative_us)
+    return total / 1000, imported
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail when a page module's import time goes over its budget.")
+    parser.add_argument('--runs', type=int, default=5, help="take the median of this many fresh interpreters")
+    parser.add_argument('modules', nargs='*', default=list(BUDGETS))
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        timings = []
+        for _ in range(args.runs):
+            elapsed, imported = measure(module)
+            timings.append(elapsed)
+        elapsed = statistics.median(timings)
+        budget = BUDGETS.get(module)
+        forbidden = [name for name in FORBIDDEN if name in imported]
+        status = 'ok'
+        if forbidden:
+            status = 'imports ' + ', '.join(forbidden)
+        elif budget is not None and elapsed > budget:
+            status = 'over budget'
+        failed = failed or status != 'ok'
+        print(f"{module:<20} {elapsed:8.1f} ms  budget {budget if budget is not None else '-':>4}  {status}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cluster import wait_healthy
+from main import PAGES
+
+PAGE_LABEL = 'Select Page'
+FILTER_LABEL = 'Filter projects by tool used'
+FILTER_VALUES = [['Python'], ['R'], ['Dart'], ['SQL'], []]
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def start_server(port, extra_args=()):
+    command = [
+        sys.executable, '-m', 'streamlit', 'run', 'main.py',
+        '--server.headless', 'true',
+        '--server.port', str(port),
+        '--browser.gatherUsageStats', 'false',
+        *extra_args,
+    ]
+    return subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def start_cluster(port, workers):
+    command = [
+        sys.executable, 'cluster.py',
+        '--workers', str(workers),
+        '--port', str(port),
+        '--base-port', str(free_port()),
+        '--browser.gatherUsageStats', 'false',
+    ]
+    return subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def children(pid):
+    with open(f'/proc/{pid}/task/{pid}/children') as f:
+        return [int(child) for child in f.read().split()]
+
+class ProcessStats:
+    # CPU and memory of the server process and its children, read from /proc.
+    def __init__(self, pids):
+        self.pids = pids
+        self.ticks = os.sysconf('SC_CLK_TCK')
+
+    def cpu_seconds(self):
+        total = 0
+        for pid in self.pids:
+            with open(f'/proc/{pid}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            total += int(fields[11]) + int(fields[12])
+        return total / self.ticks
+
+    def rss_kb(self):
+        total = 0
+        for pid in self.pids:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1])
+        return total
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def summarize(samples):
+    if not samples:
+        return {'count': 0}
+    return {
+        'count': len(samples),
+        'p50_ms': round(percentile(samples, 50), 2),
+        'p95_ms': round(percentile(samples, 95), 2),
+        'p99_ms': round(percentile(samples, 99), 2),
+        'mean_ms': round(statistics.fmean(samples), 2),
+        'max_ms': round(max(samples), 2),
+    }
+
+class Session:
+    # Speaks the same websocket protocol as the browser: a BackMsg asking for a
+    # rerun with the current widget states, answered by ForwardMsgs up to and
+    # including script_finished.
+    def __init__(self, url, index, results):
+        self.url = url.replace('http', 'ws', 1) + '/_stcore/stream'
+        self.index = index
+        self.results = results
+        self.widgets = {}
+        self.fragments = {}
+        self.states = {}
+
+    async def rerun(self, ws, action, query_string='', fragment_id=''):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = query_string
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+
+        start = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        errors = 0
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(await ws.recv())
+            kind = reply.WhichOneof('type')
+            if kind == 'delta' and reply.delta.WhichOneof('type') == 'new_element':
+                element = reply.delta.new_element
+                element_type = element.WhichOneof('type')
+                if element_type == 'exception':
+                    errors += 1
+                elif element_type in ('selectbox', 'multiselect'):
+                    widget = getattr(element, element_type)
+                    self.widgets[widget.label] = (element_type, widget)
+                    self.fragments[widget.label] = reply.delta.fragment_id
+            elif kind == 'script_finished':
+                break
+        self.results['latencies'].setdefault(action, []).append((time.perf_counter() - start) * 1000)
+        self.results['errors'] += errors
+
+    def choose(self, label, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        element_type, widget = self.widgets[label]
+        state = WidgetState(id=widget.id)
+        options = list(widget.options)
+        # Streamlit 1.40+ sends option strings; older releases send indices.
+        if element_type == 'selectbox':
+            if 'raw_value' in widget.DESCRIPTOR.fields_by_name:
+                state.string_value = value
+            else:
+                state.int_value = options.index(value)
+        else:
+            if 'raw_values' in widget.DESCRIPTOR.fields_by_name:
+                state.string_array_value.data.extend(value)
+            else:
+                state.int_array_value.data.extend(options.index(v) for v in value)
+        self.states[widget.id] = state
+        return self.fragments.get(label, '')
+
+    async def run(self, deadline):
+        import websockets
+
+        labels = list(PAGES)
+        async with websockets.connect(self.url, subprotocols=['streamlit'], max_size=None) as ws:
+            await self.rerun(ws, 'connect', 'page=home')
+            step = self.index
+            while time.monotonic() < deadline:
+                label = labels[step % len(labels)]
+                # Like the browser, only widgets still on screen keep state.
+                self.states.clear()
+                self.choose(PAGE_LABEL, label)
+                await self.rerun(ws, f'page:{PAGES[label]}')
+                if label == 'Education' and FILTER_LABEL in self.widgets:
+                    for value in FILTER_VALUES:
+                        if time.monotonic() >= deadline:
+                            break
+                        fragment_id = self.choose(FILTER_LABEL, value)
+                        await self.rerun(ws, 'education:filter', fragment_id=fragment_id)
+                step += 1
+
+async def run_sessions(url, sessions, duration, ramp_up, stats):
+    results = {'latencies': {}, 'errors': 0, 'failed_sessions': 0}
+    deadline = time.monotonic() + ramp_up + duration
+    peak_rss = 0
+
+    async def one(i):
+        await asyncio.sleep(ramp_up * i / max(1, sessions))
+        try:
+            await Session(url, i, results).run(deadline)
+        except Exception:
+            results['failed_sessions'] += 1
+
+    async def sample_memory():
+        nonlocal peak_rss
+        while time.monotonic() < deadline:
+            peak_rss = max(peak_rss, stats.rss_kb())
+            await asyncio.sleep(0.5)
+
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(one(i)) for i in range(sessions)]
+    if stats:
+        tasks.append(asyncio.create_task(sample_memory()))
+    await asyncio.gather(*tasks)
+    return results, peak_rss
+
+def load_test(url, sessions, duration, ramp_up, stats):
+    idle_rss = stats.rss_kb() if stats else None
+    cpu_start = stats.cpu_seconds() if stats else None
+    start = time.monotonic()
+    results, peak_rss = asyncio.run(run_sessions(url, sessions, duration, ramp_up, stats))
+    elapsed = time.monotonic() - start
+
+    everything = [sample for samples in results['latencies'].values() for sample in samples]
+    report = {
+        'url': url,
+        'sessions': sessions,
+        'duration_s': round(elapsed, 1),
+        'reruns': len(everything),
+        'throughput_rps': round(len(everything) / elapsed, 1),
+        'errors': results['errors'],
+        'failed_sessions': results['failed_sessions'],
+        'latency': summarize(everything),
+        'by_action': {action: summarize(samples) for action, samples in sorted(results['latencies'].items())},
+    }
+    if stats:
+        report['server'] = {
+            'cpu_cores': round((stats.cpu_seconds() - cpu_start) / elapsed, 2),
+            'idle_rss_kb': idle_rss,
+            'peak_rss_kb': peak_rss,
+            'rss_per_session_kb': round((peak_rss - idle_rss) / max(1, sessions), 1),
+        }
+    return report
+
+def run_local(args, workers):
+    port = free_port()
+    server = start_cluster(port, workers) if workers else start_server(port)
+    url = f'http://127.0.0.1:{port}'
+    try:
+        # The cluster's proxy only listens once every worker is healthy.
+        wait_healthy(url, timeout=120)
+        pids = [server.pid] + children(server.pid)
+        report = load_test(url, args.sessions, args.duration, args.ramp_up, ProcessStats(pids))
+        report['workers'] = workers or 1
+        return report
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent browser sessions against a local Streamlit server.")
+    parser.add_argument('--sessions', type=int, default=100)
+    parser.add_argument('--duration', type=float, default=30, help="seconds to run after ramp-up")
+    parser.add_argument('--ramp-up', type=float, default=5, help="seconds over which sessions connect")
+    parser.add_argument('--url', help="test an already running server instead of starting one")
+    parser.add_argument('--pid', type=int, nargs='*', help="server process ids to sample CPU and memory from, with --url")
+    parser.add_argument('--workers', type=int, default=0, help="test cluster.py with this many workers instead of a single server")
+    parser.add_argument('--compare', type=int, nargs='+', metavar='WORKERS',
+                        help="test a single server, then cluster.py with each of these worker counts, with the same load")
+    parser.add_argument('--out', help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    if args.url:
+        report = load_test(args.url, args.sessions, args.duration, args.ramp_up, ProcessStats(args.pid) if args.pid else None)
+    elif args.compare:
+        report = {'single': run_local(args, 0)}
+        for workers in args.compare:
+            report[f'workers={workers}'] = run_local(args, workers)
+    else:
+        report = run_local(args, args.workers)
+
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
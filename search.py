@@ -0,0 +1,75 @@
+import re
+from bisect import bisect_left
+
+import lru
+
+FACETS = ('tools', 'skills', 'courses')
+TEXT_FIELDS = ('group', 'heading', 'title', 'intro')
+
+TOKEN = re.compile(r'[a-z0-9+#]+')
+
+# Markdown link targets would otherwise make every project match "https".
+LINK_TARGET = re.compile(r'\]\([^)]*\)')
+
+def tokens(text):
+    return TOKEN.findall(LINK_TARGET.sub(']', text.lower()))
+
+class ProjectIndex:
+    def __init__(self, projects):
+        self.projects = projects
+        self.everything = frozenset(range(len(projects)))
+
+        facets = {facet: {} for facet in FACETS}
+        words = {}
+        for i, project in enumerate(projects):
+            for facet in FACETS:
+                for value in project.get(facet, ()):
+                    facets[facet].setdefault(value, set()).add(i)
+            text = [project[field] for field in TEXT_FIELDS if field in project]
+            text += project.bullets
+            for facet in FACETS:
+                text += project.get(facet, ())
+            for word in tokens(' '.join(text)):
+                words.setdefault(word, set()).add(i)
+
+        # Facet values are listed most common first, as the multiselect options.
+        self.facets = {
+            facet: {value: frozenset(ids) for value, ids in sorted(values.items(), key=lambda item: (-len(item[1]), item[0]))}
+            for facet, values in facets.items()
+        }
+        self.words = {word: frozenset(ids) for word, ids in words.items()}
+        self.vocabulary = sorted(self.words)
+
+    def options(self, facet):
+        return list(self.facets[facet])
+
+    def _prefix(self, prefix):
+        # Every word starting with the prefix, so results update while typing.
+        matches = set()
+        start = bisect_left(self.vocabulary, prefix)
+        for word in self.vocabulary[start:]:
+            if not word.startswith(prefix):
+                break
+            matches |= self.words[word]
+        return matches
+
+    def search(self, query='', **selected):
+        ids = self.everything
+        for facet, values in selected.items():
+            if values:
+                ids = ids & frozenset().union(*(self.facets[facet].get(value, ()) for value in values))
+        for word in tokens(query):
+            ids = ids & self._prefix(word)
+            if not ids:
+                break
+        return [self.projects[i] for i in sorted(ids)]
+
+def project_index(projects):
+    # Built once per loaded data file and shared by every session. The entry
+    # keeps the projects tuple alive, so its id cannot be reused by a newer
+    # load while the entry exists.
+    key = ('index', id(projects))
+    cached = lru.shared.get_or_create(key, lambda: (projects, ProjectIndex(projects)))
+    if cached[0] is not projects:
+        cached = lru.shared.put(key, (projects, ProjectIndex(projects)))
+    return cached[1]
@@ -0,0 +1,45 @@
+import html
+import streamlit as st
+import metrics
+import profiles
+from assets import COLUMN_SIZES, COLUMN_WIDTH, image_path, image_placeholder, image_variants, pick_variant, srcset
+
+def image(profile, name, width=COLUMN_WIDTH, container=st, caption=None, lazy=True, sizes=COLUMN_SIZES):
+    # Per-image timings only for the default profile; other profiles share one
+    # label, so the metric's label set stays bounded however many are served.
+    section = f'image/{name}' if profile.name == profiles.DEFAULT else 'image'
+    with metrics.timer(section):
+        variants = image_variants(name, profile.out_dir)
+        if variants is None:
+            # The asset pipeline has not been run; fall back to sending the
+            # original through Streamlit's media file manager.
+            container.image(image_path(name, width, profile.image_dir, profile.out_dir), width='stretch', caption=caption)
+            return
+        # Served by Streamlit's static file route from content-hashed URLs, so
+        # no per-session copy of the bytes is kept in the media file manager.
+        # The browser picks the smallest WebP bucket that fits `sizes`; the
+        # JPEGs are for browsers without WebP support.
+        # Lazy images are only fetched once they near the viewport; until then
+        # the blurred placeholder from the manifest fills their box, so a page
+        # paints at once however many images it lists.
+        style = 'width: 100%; height: auto'
+        placeholder = image_placeholder(name, profile.out_dir) if lazy else None
+        if placeholder:
+            style += f'; background: url({placeholder}) center / cover no-repeat'
+        loading = " loading='lazy' decoding='async'" if lazy else ''
+        variant = pick_variant(variants, width)
+        webp = html.escape(srcset(variants, 'webp', profile.url), quote=True)
+        jpeg = html.escape(srcset(variants, 'jpeg', profile.url), quote=True)
+        tag = (f"<picture><source type='image/webp' srcset='{webp}' sizes='{sizes}'>"
+               f"<img src='{profile.url}/{html.escape(variant['jpeg'], quote=True)}' srcset='{jpeg}' sizes='{sizes}' "
+               f"width='{variant['width']}' height='{variant['height']}'{loading} "
+               f"alt='{html.escape(caption or name, quote=True)}' style='{style}'></picture>")
+        if caption:
+            tag = f"<figure style='margin: 0'>{tag}<figcaption style='text-align: center; font-size: 14px; opacity: 0.6'>{html.escape(caption)}</figcaption></figure>"
+        container.markdown(tag, unsafe_allow_html=True)
+
+def chart(builder, data, **kwargs):
+    from charts import cached_figure
+
+    with metrics.timer(f'chart/{builder.__name__}'):
+        st.plotly_chart(cached_figure(builder, data), **kwargs)
@@ -0,0 +1,60 @@
+import streamlit as st
+import content
+import metrics
+import search
+from sections.common import image
+
+def project(profile, item, lazy=True):
+    if 'group' in item:
+        st.markdown(f"### {item.group}")
+    st.subheader(item.heading)
+    if 'image' in item:
+        col1, col2 = st.columns([1, 1]) 
+        with col1:
+            project_text(item)
+        with col2:
+            image(profile, item.image, lazy=lazy)
+    else:
+        project_text(item)
+
+def project_text(item):
+    if 'title' in item:
+        st.markdown(f"#### {item.title}")
+    if 'intro' in item:
+        st.write(item.intro)
+    st.markdown(content.bullets(item.bullets))
+
+def education(profile):
+    page = profile.load().education
+
+    st.title("Education")
+    st.header(page.school)
+    st.subheader(page.degree)
+    st.markdown(content.bullets(page.details))
+    st.divider()
+    st.header("Projects")
+    projects(profile, page)
+
+# Changing a filter reruns only this fragment, not the sidebar or the rest of
+# the page.
+@st.fragment
+def projects(profile, page):
+    metrics.count('reruns', page='education/projects')
+    index = search.project_index(page.projects)
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        tools = st.multiselect('Filter projects by tool used', index.options('tools'), default=page.default_tools, on_change=metrics.trigger, args=('tools',))
+        courses = st.multiselect('Course', index.options('courses'), on_change=metrics.trigger, args=('courses',))
+    with col2:
+        skills = st.multiselect('Skill', index.options('skills'), on_change=metrics.trigger, args=('skills',))
+        query = st.text_input('Search projects', on_change=metrics.trigger, args=('search',))
+
+    matches = index.search(query, tools=tools, skills=skills, courses=courses)
+    if not matches:
+        st.write("No projects match these filters.")
+    # The first image is usually in view on load, so only the rest are lazy.
+    first = next((i for i, item in enumerate(matches) if 'image' in item), None)
+    for i, item in enumerate(matches):
+        if i:
+            st.divider()
+        project(profile, item, lazy=i != first)
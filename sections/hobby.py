@@ -0,0 +1,28 @@
+import streamlit as st
+from datetime import date
+import content
+import timebucket
+from sections.common import image
+
+@timebucket.memoize('day')
+def get_streak(start, days):
+    start_date = date.fromisoformat(start)
+    today = timebucket.now().date()
+    days_passed = (today - start_date).days
+    streak_today = days + days_passed
+    return streak_today
+
+def hobby(profile):
+    data = profile.load()
+    st.title("Hobbies")
+    streak = get_streak(data.streak.start, data.streak.days)
+    for i, item in enumerate(data.hobbies):
+        if i:
+            st.divider()
+
+        st.subheader(item.heading)
+        col1, col2 = st.columns([1, 1]) 
+        with col1:
+            st.markdown(content.bullets(tuple(bullet.replace('{streak}', str(streak)) for bullet in item.bullets)))
+        with col2:
+            image(profile, item.image, caption=item.caption, lazy=i > 0)
@@ -0,0 +1,42 @@
+import html
+import streamlit as st
+import content
+from sections.common import chart, image
+from charts import company_plot, tools_plot, cgpa_plot, language_plot, mbti_plot
+
+def home(profile):
+    data = profile.load()
+    page = data.home
+    charts = data.charts
+
+    st.title(page.title)
+    st.header(page.header)
+    for highlight in page.highlights:
+        st.markdown(f"<h5 style='text-align: left'>{html.escape(highlight)}</h5>", unsafe_allow_html=True)
+    st.divider()
+    st.header(page.summary)
+    chart(company_plot, charts.company)
+    st.divider()
+    chart(tools_plot, charts.tools, use_container_width=True)
+    st.write(page.tools_caption)
+    st.divider()
+    chart(cgpa_plot, charts.cgpa)
+    st.divider()
+    chart(language_plot, charts.language)
+    st.divider()
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.markdown("#### Myers–Briggs Type Indicator (MBTI)")
+        st.write(page.mbti.intro)
+        st.markdown(content.bullets(page.mbti.traits))
+        st.markdown(page.mbti.link)
+    with col2:
+        st.markdown("<br>", unsafe_allow_html=True)
+        image(profile, page.mbti.image)
+
+    st.markdown("##### Test results and interpretation")
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.markdown(content.bullets(page.mbti.results))
+    with col2:
+        chart(mbti_plot, charts.mbti, use_container_width=True)
@@ -0,0 +1,25 @@
+import html
+import streamlit as st
+import content
+from sections.common import image
+
+def work(profile):
+    st.title("Work Experience")
+    for i, job in enumerate(profile.load().work):
+        if i:
+            st.divider()
+
+        st.header(job.company)
+        col1, col2 = st.columns([1, 1]) 
+
+        with col1:
+            st.subheader(job.role)
+            st.markdown("#### Accomplishment")
+            st.markdown(content.bullets(job.accomplishments))
+
+            st.markdown("#### Tools")
+            st.markdown(content.bullets(job.tools))
+        with col2:
+            st.markdown(f"<h3 style='text-align: right'>{html.escape(job.period)}</h3>", unsafe_allow_html=True)
+            st.markdown("<br>", unsafe_allow_html=True)
+            image(profile, job.image, lazy=i > 0)
@@ -0,0 +1,41 @@
+import argparse
+import os
+import sys
+import time
+
+# Starts the Streamlit server for main.py in this process. With --warmup (or
+# RESUME_WARMUP=1) the figures, search index, page imports and image variants
+# are prepared first, and the server only starts listening, and so only
+# passes its /_stcore/health check, once that is done. Any other arguments
+# are passed to `streamlit run`, e.g. `python serve.py --warmup --server.port 8501`.
+
+def main():
+    parser = argparse.ArgumentParser(description="Run main.py under Streamlit, optionally warming caches first.")
+    parser.add_argument('--warmup', action=argparse.BooleanOptionalAction, default=os.environ.get('RESUME_WARMUP') == '1')
+    parser.add_argument('--warmup-workers', type=int, default=None)
+    parser.add_argument('--build-images', action=argparse.BooleanOptionalAction, default=True,
+                        help="build missing image variants during warm-up; cluster.py builds them once for all workers")
+    parser.add_argument('--ready-file', default=os.environ.get('RESUME_READY_FILE'),
+                        help="touch this file once warm-up is done, for file-based readiness probes")
+    args, streamlit_args = parser.parse_known_args()
+
+    if args.ready_file and os.path.exists(args.ready_file):
+        os.remove(args.ready_file)
+
+    if args.warmup:
+        import warmup
+
+        start = time.perf_counter()
+        warmup.warm_up(args.warmup_workers, args.build_images)
+        print(f"Warm-up finished in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    if args.ready_file:
+        with open(args.ready_file, 'w') as f:
+            f.write(f"{os.getpid()}\n")
+
+    from streamlit.web import cli
+
+    cli.main(['run', 'main.py', *streamlit_args], prog_name='streamlit')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from functools import wraps
+from zoneinfo import ZoneInfo
+
+import lru
+
+# Values that depend on the date, like the hobby streak, are computed once per
+# time bucket (a day by default) in RESUME_TIMEZONE and recomputed on the
+# first call after the bucket ends. Anything rendered from them stays valid
+# until that boundary, which track() reports so whole pages can be cached.
+TIMEZONE = ZoneInfo(os.environ.get('RESUME_TIMEZONE', 'UTC'))
+
+PERIODS = {
+    'hour': (timedelta(hours=1), dict(minute=0, second=0, microsecond=0)),
+    'day': (timedelta(days=1), dict(hour=0, minute=0, second=0, microsecond=0)),
+}
+
+_expiry = ContextVar('expiry', default=None)
+
+def now():
+    return datetime.now(TIMEZONE)
+
+def bucket(period='day', when=None):
+    # Start and end of the bucket holding `when`, in local wall-clock time, so
+    # a day is midnight to midnight even across a DST change.
+    step, truncate = PERIODS[period]
+    start = (when or now()).astimezone(TIMEZONE).replace(**truncate)
+    return start, start + step
+
+class Expiry:
+    def __init__(self):
+        self.at = None
+
+    def update(self, end):
+        if self.at is None or end < self.at:
+            self.at = end
+
+@contextmanager
+def track():
+    # Collects the earliest bucket end of every memoized value used inside.
+    expiry = Expiry()
+    token = _expiry.set(expiry)
+    try:
+        yield expiry
+    finally:
+        _expiry.reset(token)
+
+def memoize(period='day'):
+    def decorate(func):
+        name = f'{func.__module__}.{func.__qualname__}'
+
+        @wraps(func)
+        def wrapper(*args):
+            start, end = bucket(period)
+            key = ('timed', name, args)
+            cached = lru.shared.get(key)
+            if cached is None or cached[0] != start:
+                cached = lru.shared.put(key, (start, func(*args)))
+            expiry = _expiry.get()
+            if expiry is not None:
+                expiry.update(end)
+            return cached[1]
+        return wrapper
+    return decorate
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import assets
+import profiles
+
+def timed(task, *args):
+    start = time.perf_counter()
+    task(*args)
+    return task.__name__, time.perf_counter() - start
+
+def import_pages():
+    from main import PAGES
+    from importlib import import_module
+
+    for page in PAGES.values():
+        import_module(f'sections.{page}')
+
+def build_figure(name, data):
+    import charts
+
+    charts.cached_figure(getattr(charts, f'{name}_plot'), data)
+
+def read_image(path):
+    with open(path, 'rb') as f:
+        f.read()
+
+def build_index(profile):
+    import search
+
+    search.project_index(profile.load().education.projects)
+
+def warm_up(workers=None, build_images=True):
+    start = time.perf_counter()
+    timings = {}
+    import_pages()
+    timings['imports'] = time.perf_counter() - start
+    # Every profile is warmed; the shared cache's memory cap still applies, so
+    # with many profiles only the most recently warmed ones stay in memory.
+    everyone = [profiles.get(name) for name in profiles.names()]
+    with ThreadPoolExecutor(workers) as executor:
+        figures = {}
+        indexes = {}
+        for profile in everyone:
+            for name, data in profile.load().charts.items():
+                figures[f'{profile.name}/figure/{name}'] = executor.submit(timed, build_figure, name, data)
+            indexes[f'{profile.name}/index'] = executor.submit(timed, build_index, profile)
+
+        # Builds any missing or stale image variants on the same pool, then
+        # pulls every variant into the page cache so the first visitor's image
+        # requests are served from memory.
+        images_start = time.perf_counter()
+        paths = []
+        for profile in everyone:
+            if build_images and os.path.isdir(profile.image_dir):
+                assets.build(profile.image_dir, profile.out_dir, executor=executor)
+            paths += [
+                os.path.join(profile.out_dir, variant['webp'])
+                for entry in assets.load_manifest(profile.out_dir).values() for variant in entry['variants']
+            ]
+        list(executor.map(read_image, paths))
+        timings['images'] = time.perf_counter() - images_start
+
+        for name, future in {**figures, **indexes}.items():
+            timings[name] = future.result()[1]
+    timings['total'] = time.perf_counter() - start
+    return timings
+
+def main():
+    timings = warm_up()
+    for name, seconds in timings.items():
+        print(f"warm-up {name:<20} {seconds * 1000:8.1f} ms", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()